@@ -4,15 +4,19 @@ import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, PhotoImage
 import sounddevice as sd
-import wavio
 import threading
 import time
 import requests
 import json
+import queue
 import os
+import wave
+from array import array
+from bisect import bisect_right
 from pathlib import Path
 import numpy as np
 import base64
+import uuid
 from io import BytesIO
 from PIL import Image, ImageTk  # You'll need to install pillow if not already installed
 
@@ -21,12 +25,384 @@ USER_HOME = str(Path.home())
 CONFIG_DIR = os.path.join(USER_HOME, '.config', 'TTS_UI')
 TEMP_DIR = os.path.join(USER_HOME, '.tmp', 'TTS_UI')
 
+RESPONSE_FORMATS = ('json', 'verbose_json')  # formats that return JSON with a 'text' field
+# Whisper only uses the last ~224 tokens of a prompt, and non-Latin scripts can
+# take a token or more per character, so a chained prompt is kept to this many
+# characters. The profile prompt always fits first; the previous transcription
+# only gets what is left.
+PROMPT_MAX_CHARS = 200
+DEFAULT_PROFILE = {
+    'language': '',  # empty lets the server auto-detect
+    'prompt': '',
+    'temperature': None,
+    'response_format': 'json',  # verbose_json adds word/segment timestamps
+    'chain_prompt': False,  # append the previous transcription to the prompt
+}
+PLAYBACK_BLOCK_FRAMES = 4096  # frames per playback block
+PLAYBACK_QUEUE_BLOCKS = 16  # blocks read ahead of playback (~4 s at 16 kHz)
+SILENCE_PEAK = 200  # peak sample level below which an extra source counts as silent
+
 # Create directories if they don't exist
 os.makedirs(CONFIG_DIR, exist_ok=True)
 os.makedirs(TEMP_DIR, exist_ok=True)
 
 CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.json')
-AUDIO_FILE = os.path.join(TEMP_DIR, 'recorded.wav')
+AUDIO_FILE = os.path.join(TEMP_DIR, 'recorded-{}-{}.wav')  # one per take and capture session
+CAPTURE_FILE = os.path.join(TEMP_DIR, 'capture-{}-{}.pcm')
+AUDIO_ARCHIVE_DIR = os.path.join(TEMP_DIR, 'archive')
+os.makedirs(AUDIO_ARCHIVE_DIR, exist_ok=True)
+MAX_ARCHIVE_BYTES = 1024 * 1024 * 1024  # oldest archived recordings are removed past this
+
+
+def prune_audio_archive(max_bytes=MAX_ARCHIVE_BYTES):
+    """Delete the oldest archived recordings until the archive fits in `max_bytes`"""
+    files = []
+    for name in os.listdir(AUDIO_ARCHIVE_DIR):
+        path = os.path.join(AUDIO_ARCHIVE_DIR, name)
+        try:
+            files.append((os.path.getmtime(path), os.path.getsize(path), path))
+        except OSError:
+            pass
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def pack_timings(text, items):
+    """Pack verbose_json segments or words into columnar arrays.
+
+    Instead of keeping one dict per word, the timings are stored as four
+    parallel arrays: 'start'/'end' are offsets (seconds) into the audio and
+    'char_start'/'char_end' are offsets into `text`. Items whose text cannot
+    be located in `text` are skipped.
+    """
+    timings = {
+        'start': array('f'),
+        'end': array('f'),
+        'char_start': array('I'),
+        'char_end': array('I'),
+    }
+    cursor = 0
+    for item in items:
+        token = (item.get('word') or item.get('text') or '').strip()
+        pos = text.find(token, cursor) if token else -1
+        if pos < 0:
+            continue
+        timings['start'].append(float(item.get('start', 0.0)))
+        timings['end'].append(float(item.get('end', 0.0)))
+        timings['char_start'].append(pos)
+        timings['char_end'].append(pos + len(token))
+        cursor = pos + len(token)
+    return timings
+
+
+def timings_to_json(timings):
+    """Convert packed timings to plain lists for saving"""
+    return {
+        'start': [round(t, 3) for t in timings['start']],
+        'end': [round(t, 3) for t in timings['end']],
+        'char_start': timings['char_start'].tolist(),
+        'char_end': timings['char_end'].tolist(),
+    }
+
+
+def timings_from_json(data):
+    """Rebuild packed timings from the lists written by timings_to_json"""
+    if not data:
+        return None
+    return {
+        'start': array('f', data.get('start', [])),
+        'end': array('f', data.get('end', [])),
+        'char_start': array('I', data.get('char_start', [])),
+        'char_end': array('I', data.get('char_end', [])),
+    }
+
+
+def slice_timings(timings, char_lo, char_hi):
+    """Return the items inside [char_lo, char_hi) with char offsets rebased to char_lo.
+
+    Audio offsets are left unchanged, so they still point into the same recording.
+    """
+    if not timings:
+        return None
+    lo = bisect_right(timings['char_start'], char_lo - 1)
+    hi = bisect_right(timings['char_start'], char_hi - 1)
+    sliced = {
+        'start': timings['start'][lo:hi],
+        'end': timings['end'][lo:hi],
+        'char_start': array('I', (c - char_lo for c in timings['char_start'][lo:hi])),
+        'char_end': array('I', (min(c, char_hi) - char_lo for c in timings['char_end'][lo:hi])),
+    }
+    return sliced if sliced['start'] else None
+
+
+def find_timing_at(timings, char_offset):
+    """Return the index of the item covering `char_offset`, or None"""
+    if not timings:
+        return None
+    i = bisect_right(timings['char_start'], char_offset) - 1
+    if i >= 0 and char_offset < timings['char_end'][i]:
+        return i
+    return None
+
+
+class CaptureBuffer:
+    """PCM capture buffer that spills to an append-only file past a RAM cap.
+
+    The audio callback only appends chunks to an in-memory list. `spill()` is
+    called from the recording thread and moves those chunks to `path` once
+    they exceed `max_ram_bytes`, so RAM use stays bounded on long takes.
+    """
+
+    def __init__(self, path, max_ram_bytes):
+        self.path = path
+        self.max_ram_bytes = max_ram_bytes
+        self._chunks = []
+        self._ram_bytes = 0
+        self._spilled_bytes = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self):
+        return self._ram_bytes + self._spilled_bytes
+
+    def append(self, chunk):
+        with self._lock:
+            self._chunks.append(chunk)
+            self._ram_bytes += len(chunk)
+
+    def spill(self):
+        """Move buffered chunks to disk once they exceed the RAM cap"""
+        if self._ram_bytes <= self.max_ram_bytes:
+            return
+        with self._lock:
+            chunks, self._chunks = self._chunks, []
+            ram_bytes, self._ram_bytes = self._ram_bytes, 0
+            self._spilled_bytes += ram_bytes
+        if not chunks:
+            return
+        if self._file is None:
+            self._file = open(self.path, 'wb')
+        self._file.writelines(chunks)
+
+    def write_wav(self, wav_path, fs, block_size=1 << 20):
+        """Stream the captured PCM into a mono 16-bit WAV file"""
+        with wave.open(wav_path, 'wb') as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(fs)
+            if self._file is not None:
+                self._file.flush()
+                with open(self.path, 'rb') as f:
+                    for block in iter(lambda: f.read(block_size), b''):
+                        wf.writeframesraw(block)
+            with self._lock:
+                chunks = list(self._chunks)
+            for chunk in chunks:
+                wf.writeframesraw(chunk)
+
+    def close(self):
+        """Drop buffered audio and remove the spill file"""
+        with self._lock:
+            self._chunks = []
+            self._ram_bytes = 0
+            self._spilled_bytes = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.path):
+            try:
+                os.remove(self.path)
+            except Exception:
+                pass
+
+
+class CaptureSource:
+    """One logical source: a device's mono mix or one of its channels.
+
+    Each source records into its own CaptureBuffer and has its own level gate.
+    """
+
+    def __init__(self, take_id, number, channel, label, max_ram_bytes):
+        self.channel = channel  # None = mix of the channels the stream opened
+        self.label = label
+        # Files are unique per take, so a new take never touches files
+        # that queued jobs from an earlier take are still uploading
+        self.buffer = CaptureBuffer(CAPTURE_FILE.format(take_id, number), max_ram_bytes)
+        self.wav_path = AUDIO_FILE.format(take_id, number)
+        self.peak = 0  # loudest sample seen, for the silence gate
+        self.start_time = None
+
+    def feed(self, indata):
+        if self.channel is not None:
+            samples = indata[:, self.channel]
+        elif indata.shape[1] == 1:
+            samples = indata[:, 0]
+        else:
+            samples = indata.mean(axis=1).astype('int16')
+        self.buffer.append(samples.tobytes())
+        peak = max(int(samples.max()), -int(samples.min()))
+        if peak > self.peak:
+            self.peak = peak
+
+    def heard_sound(self, threshold):
+        return self.peak >= threshold
+
+
+class CaptureSession:
+    """One input device stream feeding one or more CaptureSources.
+
+    The callback only touches this device's own sources, so its cost stays
+    the same however many other devices are recorded.
+    """
+
+    def __init__(self, device_index, sources, fs):
+        self.device_index = device_index
+        self.sources = sources
+        self.fs = fs
+        self.channels = max((source.channel + 1 for source in sources if source.channel is not None), default=1)
+        self.stream = None
+
+    def callback(self, indata, frames, time_, status):
+        if status:
+            print(f"InputStream status ({self.sources[0].label}): {status}")
+        for source in self.sources:
+            source.feed(indata)
+
+    def start(self):
+        self.stream = sd.InputStream(device=self.device_index, samplerate=self.fs, channels=self.channels,
+                                     dtype='int16', callback=self.callback)
+        self.stream.start()
+        start_time = time.time()
+        for source in self.sources:
+            source.start_time = start_time
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+
+class MultipartFileStream:
+    """multipart/form-data body that reads the file part from disk in blocks.
+
+    requests builds `files=` uploads entirely in memory. Passing this object as
+    `data=` instead sends a Content-Length and streams the audio file.
+    """
+
+    def __init__(self, fields, file_field, file_path, content_type, block_size=1 << 16):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.block_size = block_size
+
+        head = []
+        for name, value in fields.items():
+            for v in (value if isinstance(value, (list, tuple)) else [value]):
+                head.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{v}\r\n')
+        head.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; '
+                    f'filename="{os.path.basename(file_path)}"\r\nContent-Type: {content_type}\r\n\r\n')
+        head = ''.join(head).encode('utf-8')
+        tail = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
+        self._length = len(head) + os.path.getsize(file_path) + len(tail)
+        self._parts = [BytesIO(head), open(file_path, 'rb'), BytesIO(tail)]
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return iter(lambda: self.read(self.block_size), b'')
+
+    def read(self, size=-1):
+        out = []
+        while self._parts and size != 0:
+            block = self._parts[0].read(size)
+            if not block:
+                self._parts.pop(0).close()
+                continue
+            out.append(block)
+            if size > 0:
+                size -= len(block)
+        return b''.join(out)
+
+    def close(self):
+        for part in self._parts:
+            part.close()
+        self._parts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RenderScheduler:
+    """Collects UI mutations and applies them on the Tk thread in batches.
+
+    `post()` may be called from any thread; it appends to a locked queue and,
+    if no pass is scheduled yet, arms one `1000 / fps` ms later. That pass runs
+    everything queued on the Tk thread, so there are no wakeups while idle.
+    Posts with a `key` replace any pending post with the same key, so repeated
+    scroll, clipboard or scroll-region updates collapse to one per frame.
+    """
+
+    def __init__(self, root, fps=30, on_frame=None):
+        self.root = root
+        self.interval_ms = max(1, int(1000 / fps))
+        self.on_frame = on_frame
+        self.frame_time_ms = 0.0  # last batch
+        self.avg_frame_time_ms = 0.0  # exponential moving average
+        self.batch_size = 0
+        self._pending = []
+        self._keyed = {}
+        self._armed = False
+        self._lock = threading.Lock()
+
+    def post(self, func, key=None):
+        with self._lock:
+            if key is None:
+                self._pending.append(func)
+            else:
+                # Re-insert so the latest post for a key runs last
+                self._keyed.pop(key, None)
+                self._keyed[key] = func
+            arm = not self._armed
+            self._armed = True
+        # Outside the lock: tkinter hands after() from other threads to the Tk thread
+        if arm:
+            self.root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        with self._lock:
+            tasks = self._pending + list(self._keyed.values())
+            self._pending = []
+            self._keyed = {}
+            self._armed = False  # posts made from here on arm the next pass
+        if tasks:
+            start = time.perf_counter()
+            for task in tasks:
+                try:
+                    task()
+                except Exception as e:
+                    print(f"UI update failed: {e}")
+            self.frame_time_ms = (time.perf_counter() - start) * 1000
+            if self.avg_frame_time_ms:
+                self.avg_frame_time_ms = 0.9 * self.avg_frame_time_ms + 0.1 * self.frame_time_ms
+            else:
+                self.avg_frame_time_ms = self.frame_time_ms
+            self.batch_size = len(tasks)
+            if self.on_frame:
+                self.on_frame(self)
+
 
 class STT_App:
     def __init__(self, root):
@@ -108,15 +484,24 @@ class STT_App:
 
         self.recording = False
         self.fs = 16000  # Sample rate
-        self.frames = []
+        self.sessions = []
+        self.playback_stream = None  # archived audio being replayed
+        self.playback_stop = None  # tells the playback reader thread to quit
         self.record_thread = None
         self.timeout = 30  # Default timeout seconds
+        self.max_ram_mb = 32  # captured PCM beyond this spills to disk
+        self.max_record_minutes = 120  # hard cap on a single recording
         self.audio_device_index = None  # προεπιλογή (system default)
+        self.extra_audio_sources = []  # (device index, channel or None) recorded alongside the main device
 
 
         self.model_name = "whisper-1"
         self.api_base_url = ""
         self.api_token = ""
+        self.profiles = {"Default": dict(DEFAULT_PROFILE)}  # request-parameter profiles
+        self.active_profile = "Default"
+        self.profile_latency = {}  # profile name -> request latency stats
+        self.last_transcript_text = ""  # fed to profiles with chain_prompt
 
         self.load_config()
          # Initialize icons before creating widgets
@@ -125,6 +510,13 @@ class STT_App:
 
         self.create_widgets()
 
+        # All UI updates from worker threads go through the render scheduler
+        self.scheduler = RenderScheduler(self.root, on_frame=self.update_render_diagnostics)
+
+        # Recordings from every capture session share one transcription queue
+        self.transcription_queue = queue.Queue()
+        threading.Thread(target=self.transcription_worker, daemon=True).start()
+
         # Add keyboard shortcuts
         self.setup_shortcuts()
 
@@ -148,6 +540,14 @@ class STT_App:
         self.label_model = ttk.Label(model_frame, text=self.model_name, font=("Arial", 10))
         self.label_model.pack(side=tk.LEFT, padx=(5,0))
 
+        # PROFILE SELECTOR (request parameters sent with each upload)
+        self.combo_profile = ttk.Combobox(model_frame, state="readonly", width=20,
+                                          values=list(self.profiles))
+        self.combo_profile.pack(side=tk.RIGHT)
+        self.combo_profile.set(self.active_profile)
+        self.combo_profile.bind("<<ComboboxSelected>>", self.on_profile_selected)
+        ttk.Label(model_frame, text="Profile:", font=("Arial", 10, "bold")).pack(side=tk.RIGHT, padx=(0,5))
+
         # TOGGLE CONFIG BUTTON
         self.btn_toggle_config = ttk.Button(frame, text="Show Config", command=self.toggle_config)
         self.btn_toggle_config.pack(fill=tk.X, pady=(0,10))
@@ -182,11 +582,65 @@ class STT_App:
         ttk.Label(self.config_frame, text="Mic Device:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
         self.combo_device = ttk.Combobox(self.config_frame, state="readonly", width=50)
         self.combo_device.grid(row=4, column=1, sticky=tk.W, padx=5, pady=5)
+        # Extra devices or single channels recorded at the same time (e.g. a second mic or loopback)
+        ttk.Label(self.config_frame, text="Extra Sources:").grid(row=5, column=0, sticky=tk.NW, padx=5, pady=5)
+        self.list_extra_devices = tk.Listbox(self.config_frame, selectmode=tk.MULTIPLE, height=4, width=50,
+                                             exportselection=False)
+        self.list_extra_devices.grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
         self.populate_audio_devices()
 
+        # Recording memory cap and maximum length
+        ttk.Label(self.config_frame, text="RAM cap (MB):").grid(row=6, column=0, sticky=tk.W, padx=5, pady=5)
+        self.entry_max_ram = ttk.Entry(self.config_frame, width=10)
+        self.entry_max_ram.grid(row=6, column=1, sticky=tk.W, padx=5, pady=5)
+        self.entry_max_ram.insert(0, str(self.max_ram_mb))
+
+        ttk.Label(self.config_frame, text="Max length (min):").grid(row=7, column=0, sticky=tk.W, padx=5, pady=5)
+        self.entry_max_minutes = ttk.Entry(self.config_frame, width=10)
+        self.entry_max_minutes.grid(row=7, column=1, sticky=tk.W, padx=5, pady=5)
+        self.entry_max_minutes.insert(0, str(self.max_record_minutes))
+
         # Move save button after audio settings
         btn_save = ttk.Button(self.config_frame, text="Save Config", command=self.save_config)
-        btn_save.grid(row=5, column=1, sticky=tk.E, padx=5, pady=5)
+        btn_save.grid(row=8, column=1, sticky=tk.E, padx=5, pady=5)
+
+        # Profile editor (edits the profile selected next to the model name)
+        profile_frame = ttk.LabelFrame(self.config_frame, text="Request Profile")
+        profile_frame.grid(row=9, column=0, columnspan=2, sticky=tk.EW, padx=5, pady=5)
+
+        ttk.Label(profile_frame, text="Name:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.entry_profile_name = ttk.Entry(profile_frame, width=20)
+        self.entry_profile_name.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
+
+        ttk.Label(profile_frame, text="Language:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        self.entry_language = ttk.Entry(profile_frame, width=10)
+        self.entry_language.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
+        self.create_tooltip(self.entry_language, "ISO-639-1 code, e.g. en. Empty = auto-detect")
+
+        ttk.Label(profile_frame, text="Prompt:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.entry_prompt = ttk.Entry(profile_frame, width=55)
+        self.entry_prompt.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        self.create_tooltip(self.entry_prompt, "Vocabulary or style hint sent with every clip")
+
+        ttk.Label(profile_frame, text="Temperature:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.entry_temperature = ttk.Entry(profile_frame, width=10)
+        self.entry_temperature.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
+
+        ttk.Label(profile_frame, text="Response format:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
+        self.combo_response_format = ttk.Combobox(profile_frame, state="readonly", width=15,
+                                                  values=RESPONSE_FORMATS)
+        self.combo_response_format.grid(row=4, column=1, sticky=tk.W, padx=5, pady=5)
+        self.create_tooltip(self.combo_response_format, "verbose_json adds word timestamps (double-click a word to replay audio)")
+
+        self.var_chain_prompt = tk.BooleanVar()
+        ttk.Checkbutton(profile_frame, text="Use previous transcription as prompt",
+                        variable=self.var_chain_prompt).grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
+
+        profile_buttons = ttk.Frame(profile_frame)
+        profile_buttons.grid(row=6, column=1, sticky=tk.E, padx=5, pady=5)
+        ttk.Button(profile_buttons, text="Delete Profile", command=self.delete_profile).pack(side=tk.RIGHT)
+        ttk.Button(profile_buttons, text="Save Profile", command=self.save_profile).pack(side=tk.RIGHT, padx=5)
+        self.fill_profile_fields()
 
         # RECORD BUTTON - modified to use button press/release events only
         self.btn_record = ttk.Button(frame, text="Start Recording (Ctrl+R)", style="Primary.TButton")
@@ -246,6 +700,12 @@ class STT_App:
         # List to keep track of all transcription entries
         self.transcription_entries = []
 
+        # DIAGNOSTICS (render frame time)
+        self.label_diagnostics = ttk.Label(frame, text="", font=("Arial", 8), foreground="#888888")
+        self.label_diagnostics.pack(anchor=tk.W)
+        self.label_latency = ttk.Label(frame, text="", font=("Arial", 8), foreground="#888888")
+        self.label_latency.pack(anchor=tk.W)
+
         # Hide config frame initially
         self.config_visible = False
 
@@ -255,22 +715,34 @@ class STT_App:
             messagebox.showinfo("Info", "No transcriptions to clear.")
             return
             
-        if messagebox.askyesno("Confirm", "Are you sure you want to clear all transcriptions?"):
-            # Remove all transcription frames
+        if messagebox.askyesno("Confirm", "Are you sure you want to clear all transcriptions?\n"
+                                          "Their archived audio will be deleted too."):
+            self.stop_playback()
+
+            # Remove all transcription frames and their archived audio
             for entry in self.transcription_entries:
                 entry['frame'].destroy()
+                self.delete_archived_audio(entry['audio_file'])
             
             # Clear the list
             self.transcription_entries = []
             
             # Update the canvas
-            self.canvas.update_idletasks()
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            self.scheduler.post(self.update_scrollregion, key='scrollregion')
             
             self.label_status.config(text="All transcriptions cleared.")
 
 
 
+    def delete_archived_audio(self, path):
+        """Remove an entry's recording, but only if it lives in the archive directory"""
+        if not path or os.path.dirname(os.path.abspath(path)) != os.path.abspath(AUDIO_ARCHIVE_DIR):
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     def save_transcriptions(self):
         """Save all transcriptions to a JSON file"""
         if not self.transcription_entries:
@@ -282,10 +754,19 @@ class STT_App:
         # Prepare data for saving
         transcription_data = []
         for entry in self.transcription_entries:
-            transcription_data.append({
+            item = {
                 'text': entry['text'],
                 'timestamp': entry['timestamp'],
-            })
+            }
+            if entry['source']:
+                item['source'] = entry['source']
+            if entry['audio_file']:
+                item['audio_file'] = entry['audio_file']
+            if entry['segments']:
+                item['segments'] = timings_to_json(entry['segments'])
+            if entry['words']:
+                item['words'] = timings_to_json(entry['words'])
+            transcription_data.append(item)
         
         # Ask user for save location
         file_path = filedialog.asksaveasfilename(
@@ -332,7 +813,11 @@ class STT_App:
             
             # Add loaded transcriptions
             for item in transcription_data:
-                self.display_transcription(item['text'], item.get('timestamp'))
+                self.display_transcription(item['text'], item.get('timestamp'),
+                                           segments=timings_from_json(item.get('segments')),
+                                           words=timings_from_json(item.get('words')),
+                                           audio_file=item.get('audio_file'),
+                                           source=item.get('source'))
             
             messagebox.showinfo("Success", f"Loaded {len(transcription_data)} transcriptions from {file_path}")
             self.label_status.config(text=f"Transcriptions loaded from {os.path.basename(file_path)}")
@@ -345,9 +830,23 @@ class STT_App:
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
     def on_transcriptions_container_configure(self, event):
-        # Update the scroll region when the content size changes
+        # Update the scroll region once per frame, not on every child resize
+        self.scheduler.post(self.update_scrollregion, key='scrollregion')
+
+    def update_scrollregion(self):
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
+    def scroll_to_end(self):
+        # Lay out pending entries once, then jump to the bottom
+        self.canvas.update_idletasks()
+        self.update_scrollregion()
+        self.canvas.yview_moveto(1.0)
+
+    def update_render_diagnostics(self, scheduler):
+        self.label_diagnostics.config(
+            text=f"UI frame: {scheduler.frame_time_ms:.1f} ms "
+                 f"(avg {scheduler.avg_frame_time_ms:.1f} ms, {scheduler.batch_size} updates)")
+
 
     def on_record_button_press(self, event):
         self.press_start_time = time.time()
@@ -411,6 +910,18 @@ class STT_App:
                 except ValueError:
                     self.timeout = 60
                 self.audio_device_index = data.get('audio_device_index', None)
+                self.extra_audio_sources = [tuple(source) for source in data.get('extra_audio_sources', [])]
+                self.profiles = data.get('profiles') or self.profiles
+                for name, profile in self.profiles.items():
+                    self.profiles[name] = {**DEFAULT_PROFILE, **profile}
+                self.active_profile = data.get('active_profile', self.active_profile)
+                if self.active_profile not in self.profiles:
+                    self.active_profile = next(iter(self.profiles))
+                try:
+                    self.max_ram_mb = int(data.get('max_ram_mb', self.max_ram_mb))
+                    self.max_record_minutes = int(data.get('max_record_minutes', self.max_record_minutes))
+                except ValueError:
+                    pass
             except Exception as e:
                 print(f"Failed to load config from {CONFIG_FILE}:", e)
 
@@ -426,13 +937,32 @@ class STT_App:
         if not model:
             messagebox.showerror("Error", "Model cannot be empty.")
             return
+        try:
+            max_ram_mb = int(self.entry_max_ram.get().strip())
+            max_record_minutes = int(self.entry_max_minutes.get().strip())
+        except ValueError:
+            messagebox.showerror("Error", "RAM cap and max length must be whole numbers.")
+            return
+        if max_ram_mb <= 0 or max_record_minutes <= 0:
+            messagebox.showerror("Error", "RAM cap and max length must be positive.")
+            return
+        audio_device_index = self.device_index_map.get(self.combo_device.get(), self.audio_device_index)
+        extra_audio_sources = [
+            self.extra_source_map[self.list_extra_devices.get(i)]
+            for i in self.list_extra_devices.curselection()
+        ]
 
         data = {
             "base_url": base_url,
             "api_token": token,
             "model": model,
             "timeout": timeout,
-            "audio_device_index": self.audio_device_index
+            "audio_device_index": audio_device_index,
+            "extra_audio_sources": extra_audio_sources,
+            "profiles": self.profiles,
+            "active_profile": self.active_profile,
+            "max_ram_mb": max_ram_mb,
+            "max_record_minutes": max_record_minutes
         }
         try:
             with open(CONFIG_FILE, 'w') as f:
@@ -440,6 +970,10 @@ class STT_App:
             self.api_base_url = base_url
             self.api_token = token
             self.model_name = model
+            self.max_ram_mb = max_ram_mb
+            self.max_record_minutes = max_record_minutes
+            self.audio_device_index = audio_device_index
+            self.extra_audio_sources = extra_audio_sources
 
             # Ενημερώνουμε και την ετικέτα που δείχνει το μοντέλο πάνω
             self.label_model.config(text=self.model_name)
@@ -448,6 +982,110 @@ class STT_App:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save config file:\n{e}")
 
+    def store_config_values(self, **values):
+        """Update individual keys in the config file, keeping everything else"""
+        data = {}
+        if os.path.exists(CONFIG_FILE):
+            try:
+                with open(CONFIG_FILE, 'r') as f:
+                    data = json.load(f)
+            except Exception:
+                data = {}
+        data.update(values)
+        try:
+            with open(CONFIG_FILE, 'w') as f:
+                json.dump(data, f)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save config file:\n{e}")
+
+    def on_profile_selected(self, event):
+        self.active_profile = self.combo_profile.get()
+        self.fill_profile_fields()
+        self.store_config_values(active_profile=self.active_profile)
+        self.update_latency_diagnostics()
+
+    def fill_profile_fields(self):
+        """Show the active profile in the profile editor"""
+        profile = self.profiles[self.active_profile]
+        self.entry_profile_name.delete(0, tk.END)
+        self.entry_profile_name.insert(0, self.active_profile)
+        self.entry_language.delete(0, tk.END)
+        self.entry_language.insert(0, profile['language'])
+        self.entry_prompt.delete(0, tk.END)
+        self.entry_prompt.insert(0, profile['prompt'])
+        self.entry_temperature.delete(0, tk.END)
+        if profile['temperature'] is not None:
+            self.entry_temperature.insert(0, str(profile['temperature']))
+        self.combo_response_format.set(profile['response_format'])
+        self.var_chain_prompt.set(profile['chain_prompt'])
+
+    def refresh_profile_selector(self):
+        self.combo_profile['values'] = list(self.profiles)
+        self.combo_profile.set(self.active_profile)
+
+    def save_profile(self):
+        """Create or update a profile from the profile editor"""
+        name = self.entry_profile_name.get().strip()
+        if not name:
+            messagebox.showerror("Error", "Profile name cannot be empty.")
+            return
+        temperature = self.entry_temperature.get().strip()
+        if temperature:
+            try:
+                temperature = float(temperature)
+            except ValueError:
+                messagebox.showerror("Error", "Temperature must be a number between 0 and 1.")
+                return
+            if not 0 <= temperature <= 1:
+                messagebox.showerror("Error", "Temperature must be a number between 0 and 1.")
+                return
+        else:
+            temperature = None
+
+        self.profiles[name] = {
+            'language': self.entry_language.get().strip(),
+            'prompt': self.entry_prompt.get().strip(),
+            'temperature': temperature,
+            'response_format': self.combo_response_format.get() or 'json',
+            'chain_prompt': self.var_chain_prompt.get(),
+        }
+        self.active_profile = name
+        self.refresh_profile_selector()
+        self.store_config_values(profiles=self.profiles, active_profile=self.active_profile)
+        self.label_status.config(text=f"Profile '{name}' saved.")
+
+    def delete_profile(self):
+        if len(self.profiles) == 1:
+            messagebox.showerror("Error", "At least one profile is required.")
+            return
+        if not messagebox.askyesno("Confirm", f"Delete profile '{self.active_profile}'?"):
+            return
+        del self.profiles[self.active_profile]
+        self.active_profile = next(iter(self.profiles))
+        self.refresh_profile_selector()
+        self.fill_profile_fields()
+        self.store_config_values(profiles=self.profiles, active_profile=self.active_profile)
+
+    def record_latency(self, profile_name, latency, audio_seconds):
+        """Accumulate request latency per profile (runs on the Tk thread)"""
+        stats = self.profile_latency.setdefault(profile_name, {'count': 0, 'total': 0.0, 'audio': 0.0, 'last': 0.0})
+        stats['count'] += 1
+        stats['total'] += latency
+        stats['audio'] += audio_seconds
+        stats['last'] = latency
+        self.update_latency_diagnostics()
+
+    def update_latency_diagnostics(self):
+        """Show request latency for each profile used this session, active profile first"""
+        names = sorted(self.profile_latency, key=lambda name: name != self.active_profile)
+        parts = []
+        for name in names:
+            stats = self.profile_latency[name]
+            per_minute = stats['total'] / stats['audio'] * 60 if stats['audio'] else 0.0
+            parts.append(f"{name}: last {stats['last']:.2f} s, avg {stats['total'] / stats['count']:.2f} s "
+                         f"({per_minute:.1f} s per audio min, n={stats['count']})")
+        self.label_latency.config(text="Latency - " + " | ".join(parts) if parts else "")
+
     def toggle_recording(self):
         # Only use toggle for short presses or keyboard shortcuts
         if self.recording:
@@ -461,11 +1099,22 @@ class STT_App:
             return
         self.recording = True
         self.btn_record.config(text="Stop Recording (Ctrl+R)", style="Recording.TButton")  # Change to red style
-        self.frames = []
-        
+
+        # One capture source per selected device or channel, main device mix first;
+        # sources on the same device share one stream (capture session)
+        main_source = (self.audio_device_index, None)
+        selected = [main_source] + [source for source in self.extra_audio_sources if source != main_source]
+        max_ram_bytes = self.max_ram_mb * 1024 * 1024
+        take_id = uuid.uuid4().hex[:12]
+        by_device = {}
+        for n, (idx, channel) in enumerate(selected):
+            by_device.setdefault(idx, []).append(
+                CaptureSource(take_id, n, channel, self.source_label(idx, channel), max_ram_bytes))
+        self.sessions = [CaptureSession(idx, sources, self.fs) for idx, sources in by_device.items()]
+
         self.label_status.config(text="Recording... 0 s")
         self.record_start_time = time.time()
-        self.record_thread = threading.Thread(target=self.record_audio, daemon=True)
+        self.record_thread = threading.Thread(target=self.record_audio, args=(self.sessions,), daemon=True)
         self.record_thread.start()
         self.update_recording_time()
 
@@ -481,72 +1130,196 @@ class STT_App:
             self.label_status.config(text=f"Recording... {elapsed} s")
             self.root.after(500, self.update_recording_time)
 
-    def record_audio(self):
+    def record_audio(self, sessions):
+        max_bytes = self.max_record_minutes * 60 * self.fs * 2  # 16-bit mono
         try:
-            with sd.InputStream(samplerate=self.fs, channels=1, dtype='int16', callback=self.audio_callback):
+            try:
+                # The main device must open; an extra device that fails is skipped
+                sessions[0].start()
+                active = [sessions[0]]
+                for session in sessions[1:]:
+                    try:
+                        session.start()
+                        active.append(session)
+                    except Exception as e:
+                        session.stop()
+                        self.post_message(messagebox.showwarning, "Warning",
+                                          f"Could not open {session.sources[0].label}, recording without it:\n{e}")
+                sources = [source for session in active for source in session.sources]
                 while self.recording:
                     sd.sleep(100)
-            if len(self.frames) == 0:
-                self.root.after(0, lambda: messagebox.showwarning("Warning", "No audio recorded."))
+                    # Spilling happens here, never in the audio callbacks
+                    for source in sources:
+                        source.buffer.spill()
+                    if max(source.buffer.nbytes for source in sources) >= max_bytes:
+                        self.recording = False
+                        self.scheduler.post(self.on_max_duration_reached)
+            finally:
+                for session in sessions:
+                    session.stop()
+
+            # Skip extra sources that only captured silence; the main device is always kept
+            recorded = [sources[0]] + [source for source in sources[1:] if source.heard_sound(SILENCE_PEAK)]
+            recorded = [source for source in recorded if source.buffer.nbytes > 0]
+            if not recorded:
+                self.post_message(messagebox.showwarning, "Warning", "No audio recorded.")
                 return
-            audio_data_bytes = b''.join(self.frames)
-            data_np = np.frombuffer(audio_data_bytes, dtype='int16')
-            wavio.write(AUDIO_FILE, data_np, self.fs, sampwidth=2)
-            self.root.after(0, self.transcribe_audio)
+
+            # Write every WAV before queuing anything, so a failed write
+            # cannot leave a take waiting for a job that was never queued
+            try:
+                for source in recorded:
+                    source.buffer.write_wav(source.wav_path, self.fs)
+            except Exception:
+                for source in recorded:
+                    if os.path.exists(source.wav_path):
+                        os.remove(source.wav_path)
+                raise
+
+            take = {'pending': len(recorded), 'results': [], 'multi_source': len(sources) > 1}
+            for source in recorded:
+                self.transcription_queue.put({
+                    'take': take,
+                    'wav_path': source.wav_path,
+                    'source': source.label,
+                    'profile_name': self.active_profile,
+                    'profile': dict(self.profiles[self.active_profile]),
+                    'start_time': source.start_time,
+                })
+            self.scheduler.post(lambda: self.label_status.config(text="Transcribing audio..."))
 
         except Exception as e:
             self.recording = False
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Recording failed:\n{e}"))
-            self.root.after(0, lambda: self.btn_record.config(text="Start Recording"))
-            self.label_status.config(text="Recording failed.")
-
-    def audio_callback(self, indata, frames, time_, status):
-        if status:
-            print(f"InputStream status: {status}")
-        self.frames.append(indata.copy().tobytes())
-
-    def transcribe_audio(self):
-        # We don't need to modify any text widget here anymore since we're 
-        # creating new text widgets for each transcription
-        # Just update the status and start the transcription thread
-        self.label_status.config(text="Transcribing audio...")
-        threading.Thread(target=self._transcribe_thread, daemon=True).start()
-
-    def _transcribe_thread(self):
+            self.post_message(messagebox.showerror, "Error", f"Recording failed:\n{e}")
+            self.scheduler.post(lambda: self.btn_record.config(text="Start Recording (Ctrl+R)", style="Primary.TButton"))
+            self.scheduler.post(lambda: self.label_status.config(text="Recording failed."))
+        finally:
+            for session in sessions:
+                for source in session.sources:
+                    source.buffer.close()
+
+    def on_max_duration_reached(self):
+        """Stop a recording that hit the configured maximum length"""
+        self.stop_recording()
+        self.post_message(messagebox.showwarning, "Recording Stopped",
+                          f"Recording reached the maximum length of {self.max_record_minutes} min "
+                          "and was stopped. It will be transcribed now.")
+
+    def post_message(self, show, title, message):
+        """Show a dialog from any thread, outside the scheduler's timed pass"""
+        self.scheduler.post(lambda: self.root.after_idle(show, title, message))
+
+    def transcription_worker(self):
+        """Send queued recordings to the API one at a time, shared by all sessions"""
+        while True:
+            job = self.transcription_queue.get()
+            take = job['take']
+            result = self.request_transcription(job['wav_path'], job['profile_name'], job['profile'],
+                                                want_segments=take['multi_source'])
+            if result is not None:
+                take['results'].append((job, result))
+            take['pending'] -= 1
+            if take['pending'] == 0 and take['results']:
+                self.scheduler.post(lambda take=take: self.display_take(take))
+
+    def request_transcription(self, wav_path, profile_name, profile, want_segments=False):
+        """Upload one WAV file. Returns (text, segments, words, audio_file) or None on failure."""
         try:
-            with open(AUDIO_FILE, 'rb') as f:
-                files = {
-                    'file': (AUDIO_FILE, f, 'audio/wav')
-                }
+            url = self.api_base_url.rstrip('/') + "/v1/audio/transcriptions"
+            data = {
+                "model": self.model_name
+            }
+            # A known language skips server-side detection; a prompt primes vocabulary
+            if profile['language']:
+                data["language"] = profile['language']
+            prompt = profile['prompt']
+            tail_chars = PROMPT_MAX_CHARS - len(prompt) - 1
+            if profile['chain_prompt'] and self.last_transcript_text and tail_chars > 0:
+                # Vocabulary prompt goes last, where Whisper never truncates it
+                prompt = f"{self.last_transcript_text[-tail_chars:]} {prompt}".strip()
+            if prompt:
+                data["prompt"] = prompt
+            if profile['temperature'] is not None:
+                data["temperature"] = profile['temperature']
+            if profile['response_format'] == 'verbose_json':
+                data["response_format"] = "verbose_json"
+                data["timestamp_granularities[]"] = ["word", "segment"]
+            elif want_segments:
+                # Segment times are needed to interleave several sources
+                data["response_format"] = "verbose_json"
+                data["timestamp_granularities[]"] = ["segment"]
+            # Stream the WAV from disk rather than building the body in memory
+            with MultipartFileStream(data, 'file', wav_path, 'audio/wav') as body:
                 headers = {
-                    'Authorization': f'Bearer {self.api_token}'
+                    'Authorization': f'Bearer {self.api_token}',
+                    'Content-Type': body.content_type
                 }
-                url = self.api_base_url.rstrip('/') + "/v1/audio/transcriptions"
-                data = {
-                    "model": self.model_name
-                }
-                response = requests.post(url, headers=headers, files=files, data=data, timeout=self.timeout)
-                if response.status_code == 200:
-                    json_resp = response.json()
-                    text = json_resp.get('text', '')
-                    self.root.after(0, lambda: self.display_transcription(text))
-                else:
-                    try:
-                        err = response.json()
-                    except Exception:
-                        err = response.text
-                    self.root.after(0, lambda: messagebox.showerror("API Error", f"Status {response.status_code}:\n{err}"))
+                started = time.perf_counter()
+                response = requests.post(url, headers=headers, data=body, timeout=self.timeout)
+                latency = time.perf_counter() - started
+            if response.status_code == 200:
+                audio_seconds = (os.path.getsize(wav_path) - 44) / (self.fs * 2)  # 16-bit mono WAV
+                # Stats are only touched on the Tk thread
+                self.scheduler.post(lambda: self.record_latency(profile_name, latency, audio_seconds))
+                json_resp = response.json()
+                text = json_resp.get('text', '')
+                segments = pack_timings(text, json_resp.get('segments') or [])
+                words = pack_timings(text, json_resp.get('words') or [])
+                audio_file = None
+                if segments['start'] or words['start']:
+                    # Keep the audio so clicking a word can replay from that point
+                    audio_file = os.path.join(AUDIO_ARCHIVE_DIR,
+                                              f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.wav")
+                    os.replace(wav_path, audio_file)
+                    prune_audio_archive()
+                return text, segments, words, audio_file
+            else:
+                try:
+                    err = response.json()
+                except Exception:
+                    err = response.text
+                self.post_message(messagebox.showerror, "API Error", f"Status {response.status_code}:\n{err}")
         except Exception as e:
-            self.root.after(0, lambda e=e: messagebox.showerror("Transcription Failed", str(e)))
+            self.post_message(messagebox.showerror, "Transcription Failed", str(e))
         finally:
-            if os.path.exists(AUDIO_FILE):
+            if os.path.exists(wav_path):
                 try:
-                    os.remove(AUDIO_FILE)
+                    os.remove(wav_path)
                 except Exception:
                     pass
+        return None
+
+    def display_take(self, take):
+        """Show the results of one recording, interleaving sources by time"""
+        if not take['multi_source']:
+            job, (text, segments, words, audio_file) = take['results'][0]
+            self.display_transcription(text, segments=segments, words=words, audio_file=audio_file)
+            self.last_transcript_text = text
+            return
 
-    
-    def display_transcription(self, text, timestamp=None):
+        pieces = []
+        for job, (text, segments, words, audio_file) in take['results']:
+            if not segments['start']:
+                pieces.append((job['start_time'], job['source'], text, None, words, audio_file))
+                continue
+            for i in range(len(segments['start'])):
+                lo, hi = segments['char_start'][i], segments['char_end'][i]
+                pieces.append((job['start_time'] + segments['start'][i], job['source'], text[lo:hi],
+                               slice_timings(segments, lo, hi), slice_timings(words, lo, hi), audio_file))
+        pieces.sort(key=lambda piece: piece[0])
+        for start, source, text, segments, words, audio_file in pieces:
+            self.display_transcription(text, time.strftime("%H:%M:%S", time.localtime(start)),
+                                       segments=segments, words=words, audio_file=audio_file, source=source,
+                                       copy=False)
+        # Copy the whole interleaved take once, not just its last segment
+        take_text = "\n".join(f"{piece[1]}: {piece[2]}" for piece in pieces if piece[2].strip())
+        if take_text:
+            self.scheduler.post(lambda: self.copy_specific_text(take_text), key='clipboard')
+        # Only live results (not loaded files) prime chained prompts
+        self.last_transcript_text = " ".join(piece[2] for piece in pieces)
+
+    def display_transcription(self, text, timestamp=None, segments=None, words=None, audio_file=None, source=None,
+                              copy=True):
         # Use provided timestamp or create a new one
         if timestamp is None:
             timestamp = time.strftime("%H:%M:%S", time.localtime())
@@ -563,6 +1336,11 @@ class STT_App:
         timestamp_label = ttk.Label(header_frame, text=f"[{timestamp}]", 
                                 font=("Arial", 9, "italic"), foreground="#666666")
         timestamp_label.pack(side=tk.LEFT, padx=(5, 0))
+
+        # Add source label when several devices were recorded
+        if source:
+            ttk.Label(header_frame, text=source, font=("Arial", 9, "bold"),
+                      foreground="#4361ee").pack(side=tk.LEFT, padx=(5, 0))
         
         # Add copy button for this entry
         if self.copy_icon is None:
@@ -588,35 +1366,115 @@ class STT_App:
         ttk.Separator(entry_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, expand=True, pady=(5, 0))
         
         # Store the entry information
-        self.transcription_entries.append({
+        entry = {
             'frame': entry_frame,
             'text': text,
             'text_widget': text_widget,
             'copy_button': copy_btn,
-            'timestamp': timestamp
-        })
+            'timestamp': timestamp,
+            'source': source,
+            'segments': segments if segments and segments['start'] else None,
+            'words': words if words and words['start'] else None,
+            'audio_file': audio_file
+        }
+        self.transcription_entries.append(entry)
+
+        # Double-clicking a word jumps to that point in the archived audio;
+        # single clicks and drags are left for selecting text
+        if audio_file and (entry['words'] or entry['segments']):
+            text_widget.config(cursor="hand2")
+            text_widget.bind("<Double-Button-1>", lambda event, e=entry: self.on_transcription_click(event, e))
         
-        # Scroll to show the new entry
-        self.canvas.update_idletasks()
-        self.canvas.yview_moveto(1.0)
+        # Scroll to show the new entry (coalesced with other entries this frame)
+        self.scheduler.post(self.scroll_to_end, key='scroll')
         
         # Update status
         self.label_status.config(text="Transcription completed.")
         
-        # Copy the latest text to clipboard for convenience
-        if text.strip():
-            self.root.clipboard_clear()
-            self.root.clipboard_append(text)
+        # Copy the latest text to clipboard for convenience; only the newest
+        # text of a frame is written
+        if copy and text.strip():
+            self.scheduler.post(lambda t=text: self.copy_specific_text(t), key='clipboard')
             
             # Provide visual feedback
-            self.tick_icon = self.get_tick_icon()
+            if self.tick_icon is None:
+                self.tick_icon = self.get_tick_icon()
             if self.tick_icon:
                 copy_btn.config(image=self.tick_icon)
                 self.root.after(2000, lambda btn=copy_btn: btn.config(image=self.copy_icon))
-        
-        # Make sure we're not in recording state when transcription completes
-        self.recording = False
-        self.btn_record.config(text="Start Recording (Ctrl+R)")
+
+    def on_transcription_click(self, event, entry):
+        """Replay the archived audio from the word (or segment) under the pointer"""
+        index = event.widget.index(f"@{event.x},{event.y}")
+        offset = len(event.widget.get("1.0", index))
+        for timings in (entry['words'], entry['segments']):
+            i = find_timing_at(timings, offset)
+            if i is not None:
+                self.play_archived_audio(entry['audio_file'], timings['start'][i])
+                return
+
+    def play_archived_audio(self, path, offset):
+        """Play an archived recording starting `offset` seconds in"""
+        if not os.path.exists(path):
+            self.label_status.config(text="Archived audio not found.")
+            return
+        self.stop_playback()
+        try:
+            with wave.open(path, 'rb') as wf:
+                rate = wf.getframerate()
+                start = min(int(offset * rate), wf.getnframes())
+
+            # A reader thread feeds a small queue, so the realtime callback never
+            # touches the file and long recordings never sit in RAM
+            blocks = queue.Queue(maxsize=PLAYBACK_QUEUE_BLOCKS)
+            stop = threading.Event()
+
+            def reader():
+                with wave.open(path, 'rb') as wf:
+                    wf.setpos(start)
+                    while not stop.is_set():
+                        block = np.frombuffer(wf.readframes(PLAYBACK_BLOCK_FRAMES), dtype='int16')
+                        while not stop.is_set():
+                            try:
+                                blocks.put(block, timeout=0.1)
+                                break
+                            except queue.Full:
+                                pass
+                        if len(block) < PLAYBACK_BLOCK_FRAMES:
+                            return  # a short block marks the end of the file
+
+            def callback(outdata, frames, time_, status):
+                try:
+                    block = blocks.get_nowait()
+                except queue.Empty:
+                    outdata.fill(0)  # reader fell behind; play silence
+                    return
+                outdata[:len(block), 0] = block
+                outdata[len(block):] = 0
+                if len(block) < frames:
+                    raise sd.CallbackStop
+
+            threading.Thread(target=reader, daemon=True).start()
+            self.playback_stop = stop
+            self.playback_stream = sd.OutputStream(samplerate=rate, channels=1, dtype='int16',
+                                                   blocksize=PLAYBACK_BLOCK_FRAMES, callback=callback)
+            self.playback_stream.start()
+            self.label_status.config(text=f"Playing from {offset:.1f} s")
+        except Exception as e:
+            self.stop_playback()
+            messagebox.showerror("Error", f"Playback failed:\n{e}")
+
+    def stop_playback(self):
+        if self.playback_stop is not None:
+            self.playback_stop.set()
+            self.playback_stop = None
+        if self.playback_stream is not None:
+            try:
+                self.playback_stream.stop()
+                self.playback_stream.close()
+            except Exception:
+                pass
+            self.playback_stream = None
 
     def copy_specific_text(self, text):
         """Copy a specific transcription text to clipboard"""
@@ -633,7 +1491,8 @@ class STT_App:
             return
             
         # Concatenate all transcription texts
-        all_text = "\n".join([f"[{entry['timestamp']}] {entry['text']}" for entry in self.transcription_entries])
+        all_text = "\n".join([f"[{entry['timestamp']}] {entry['source'] + ': ' if entry['source'] else ''}{entry['text']}"
+                              for entry in self.transcription_entries])
         
         self.root.clipboard_clear()
         self.root.clipboard_append(all_text)
@@ -654,6 +1513,25 @@ class STT_App:
 
         self.combo_device['values'] = input_devices
 
+        # Extra sources: each device's mix, plus each channel of multi-channel devices
+        self.extra_source_map = {}  # label -> (device index, channel or None)
+        for name in input_devices:
+            idx = self.device_index_map[name]
+            self.extra_source_map[name] = (idx, None)
+            channels = devices[idx]['max_input_channels']
+            if channels > 1:
+                for channel in range(channels):
+                    self.extra_source_map[self.source_label(idx, channel)] = (idx, channel)
+
+        # Forget sources that were unplugged or renumbered since the config was saved
+        available = set(self.extra_source_map.values())
+        self.extra_audio_sources = [source for source in self.extra_audio_sources if source in available]
+        self.list_extra_devices.delete(0, tk.END)
+        for label, source in self.extra_source_map.items():
+            self.list_extra_devices.insert(tk.END, label)
+            if source in self.extra_audio_sources:
+                self.list_extra_devices.selection_set(tk.END)
+
         # Επιλογή αποθηκευμένης ή default
         selected_name = None
         if self.audio_device_index is not None:
@@ -670,6 +1548,17 @@ class STT_App:
             self.combo_device.set('No input device found')
             self.audio_device_index = None
 
+    def source_label(self, device_index, channel=None):
+        """Label for a capture source, unique even for identical devices"""
+        if device_index is None:
+            label = "Default"
+        else:
+            label = next((name for name, idx in self.device_index_map.items() if idx == device_index),
+                         f"Device {device_index}")
+        if channel is not None:
+            label += f" ch {channel + 1}"
+        return label
+
     def create_tooltip(self, widget, text):
         def enter(event):
             self.tooltip = tk.Toplevel(widget)